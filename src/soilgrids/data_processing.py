@@ -41,49 +41,87 @@ Data sources:
       http://opendap.biodt.eu/grasslands-pdt/soilMapsHiHydroSoil/
 """
 
-from soilgrids import get_soil_data as gsd
+from numbers import Real
+
 from soilgrids.logger_config import logger
 
 
-def data_processing(coordinates, *, file_name=None, hhs_cache=None):
+def check_coordinates(coordinates):
     """
-    Download data from SoilGrids and HiHydroSoil maps. Convert to .txt files.
+    Check that coordinates are correctly defined, before any data are requested.
 
     Parameters:
         coordinates (dict): Dictionary with 'lat' and 'lon' keys ({'lat': float, 'lon': float}).
-        file_name (str or Path): File name to save soil data (default is None, default file name is used if not provided).
-        hhs_cache (Path): Path for local HiHydroSoil map directory (optional).
-    """
-    # SoilGrids nitrogen part of the data in commits before 2024-09-30
 
-    if "lat" in coordinates and "lon" in coordinates:
-        logger.info(
-            f"Preparing soil data for latitude: {coordinates['lat']}, longitude: {coordinates['lon']} ..."
+    Raises:
+        ValueError: If coordinates are not numbers with latitude in [-90, 90] and longitude in [-180, 180].
+    """
+    try:
+        lat, lon = coordinates["lat"], coordinates["lon"]
+        valid = (
+            isinstance(lat, Real)
+            and isinstance(lon, Real)
+            and -90 <= lat <= 90
+            and -180 <= lon <= 180
         )
-    else:
+    except (KeyError, TypeError):
+        valid = False
+
+    if not valid:
         try:
             raise ValueError(
-                "Coordinates not correctly defined. Please provide as dictionary ({'lat': float, 'lon': float})!"
+                "Coordinates not correctly defined. Please provide as dictionary ({'lat': float, 'lon': float}), "
+                "with latitude in [-90, 90] and longitude in [-180, 180]!"
             )
         except ValueError as e:
             logger.error(e)
             raise
 
-    # SoilGrids composition part of the data
+
+def data_processing(coordinates, *, file_name=None, hhs_cache=None, sg_cache=None):
+    """
+    Download data from SoilGrids and HiHydroSoil maps. Convert to .txt files.
+
+    Parameters:
+        coordinates (dict): Dictionary with 'lat' and 'lon' keys ({'lat': float, 'lon': float}).
+        file_name (str or Path): File name to save soil data (default is None, default file name is used if not provided).
+        hhs_cache (Path): Path for local HiHydroSoil map directory (optional).
+        sg_cache (Path): Path for local SoilGrids cache directory (optional).
+    """
+    # SoilGrids nitrogen part of the data in commits before 2024-09-30
+
+    check_coordinates(coordinates)
+    logger.info(
+        f"Preparing soil data for latitude: {coordinates['lat']}, longitude: {coordinates['lon']} ..."
+    )
+
+    # Import data functions (and their heavy dependencies) only after coordinates were validated
+    from soilgrids import get_soil_data as gsd
+    from soilgrids import utils as ut
+
     composition_property_names = ["silt", "clay", "sand"]
     composition_request = gsd.configure_soilgrids_request(
         coordinates, composition_property_names
     )
-    composition_raw, time_stamp = gsd.download_soilgrids(composition_request)
+
+    # Run SoilGrids download and HiHydroSoil map reading at the same time (independent data sources)
+    executor = ut.get_thread_pool("data_processing", 2)
+    composition_future = executor.submit(
+        gsd.download_soilgrids, composition_request, cache=sg_cache
+    )
+    hihydrosoil_future = executor.submit(
+        gsd.get_hihydrosoil_data, coordinates, cache=hhs_cache
+    )
+
+    # SoilGrids composition part of the data
+    composition_raw, time_stamp = composition_future.result()
     data_query_protocol = [[composition_request["url"], time_stamp]]
     composition_data = gsd.get_soilgrids_data(
         composition_raw, composition_property_names
     )
 
     # HiHydroSoil part of the data
-    hihydrosoil_data, hihydrosoil_queries = gsd.get_hihydrosoil_data(
-        coordinates, cache=hhs_cache
-    )
+    hihydrosoil_data, hihydrosoil_queries = hihydrosoil_future.result()
     data_query_protocol.extend(hihydrosoil_queries)
 
     gsd.soil_data_to_txt_file(
@@ -94,3 +132,73 @@ def data_processing(coordinates, *, file_name=None, hhs_cache=None):
         data_query_protocol,
         file_name,
     )
+
+
+def data_processing_batch(
+    coordinates_list, *, hhs_cache=None, sg_cache=None, max_workers=5
+):
+    """
+    Download data from SoilGrids and HiHydroSoil maps for multiple locations concurrently. Convert to .txt files.
+
+    Parameters:
+        coordinates_list (list): List of dictionaries with 'lat' and 'lon' keys ({'lat': float, 'lon': float}).
+        hhs_cache (Path): Path for local HiHydroSoil map directory (optional).
+        sg_cache (Path): Path for local SoilGrids cache directory (optional).
+        max_workers (int): Maximum number of locations processed at the same time (default is 5).
+    """
+    # Check all locations before any data are requested
+    for coordinates in coordinates_list:
+        check_coordinates(coordinates)
+
+    # Import data functions (and their heavy dependencies) only after coordinates were validated
+    from soilgrids import get_soil_data as gsd
+    from soilgrids import utils as ut
+
+    # Request each distinct location only once (same location would also write the same file)
+    unique_coordinates = list(
+        {
+            (coordinates["lat"], coordinates["lon"]): coordinates
+            for coordinates in coordinates_list
+        }.values()
+    )
+    logger.info(
+        f"Preparing soil data for {len(unique_coordinates)} locations "
+        f"(max. {max_workers} at the same time) ..."
+    )
+    composition_property_names = ["silt", "clay", "sand"]
+    composition_requests = [
+        gsd.configure_soilgrids_request(coordinates, composition_property_names)
+        for coordinates in unique_coordinates
+    ]
+    file_names = gsd.construct_soil_data_file_names(
+        gsd.SOIL_DATA_FOLDER, unique_coordinates
+    )
+
+    # Downloads are network-bound, so run them in threads: HiHydroSoil maps are read once for all
+    # locations, SoilGrids data are downloaded per location
+    executor = ut.get_thread_pool("data_processing", max_workers)
+    hihydrosoil_future = executor.submit(
+        gsd.get_hihydrosoil_data_batch, unique_coordinates, cache=hhs_cache
+    )
+    composition_futures = [
+        executor.submit(gsd.download_soilgrids, request, cache=sg_cache)
+        for request in composition_requests
+    ]
+    hihydrosoil_data, hihydrosoil_queries = hihydrosoil_future.result()
+
+    # Write soil data for each location to its default file name
+    for c_index, coordinates in enumerate(unique_coordinates):
+        composition_raw, time_stamp = composition_futures[c_index].result()
+        data_query_protocol = [[composition_requests[c_index]["url"], time_stamp]]
+        data_query_protocol.extend(hihydrosoil_queries)
+        composition_data = gsd.get_soilgrids_data(
+            composition_raw, composition_property_names
+        )
+        gsd.soil_data_to_txt_file(
+            coordinates,
+            composition_data,
+            composition_property_names,
+            hihydrosoil_data[:, :, c_index],
+            data_query_protocol,
+            file_names[c_index],
+        )
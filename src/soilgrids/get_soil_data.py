@@ -41,7 +41,15 @@ Data sources:
       http://opendap.biodt.eu/grasslands-pdt/soilMapsHiHydroSoil/
 """
 
+import hashlib
+import json
+import logging
+import os
+import random
+import tempfile
+import threading
 import time
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
 from pathlib import Path
 from types import MappingProxyType
@@ -52,6 +60,69 @@ import requests
 from soilgrids import utils as ut
 from soilgrids.logger_config import logger
 
+try:
+    # Optional, faster parsing of JSON responses (accepts bytes like json.loads)
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Define source URLs (SoilGrids REST API query, HiHydroSoil map directory)
+SOILGRIDS_URL = "https://rest.isric.org/soilgrids/v2.0/properties/query"
+HIHYDROSOIL_URL = "http://opendap.biodt.eu/grasslands-pdt/soilMapsHiHydroSoil/"
+
+# Define SoilGrids depths and values to request (same for all requests)
+SOILGRIDS_DEPTHS = ("0-5cm", "5-15cm", "15-30cm", "30-60cm", "60-100cm", "100-200cm")
+SOILGRIDS_VALUES = ("mean",)
+SOILGRIDS_DEPTH_INDICES = MappingProxyType(
+    {depth: d_index for d_index, depth in enumerate(SOILGRIDS_DEPTHS)}
+)
+
+# Decimals of coordinates in SoilGrids request keys (as in soil data file names, ~0.1m)
+SOILGRIDS_KEY_DECIMALS = 6
+
+# In-memory cache of SoilGrids responses (request key: (data, time stamp)), least recently used first
+SOILGRIDS_MEMORY_CACHE_SIZE = 512
+_soilgrids_memory_cache = OrderedDict()
+_soilgrids_memory_cache_lock = threading.Lock()
+
+# SoilGrids fair use policy: maximum number of requests per minute (None for no limit)
+SOILGRIDS_REQUESTS_PER_MINUTE = 5
+
+# Shared SoilGrids rate limit state for all threads (monotonic time in seconds before which no request is sent,
+# and monotonic times of the most recent requests)
+_soilgrids_rate_limit = {"next_request_time": 0.0}
+_soilgrids_request_times = deque()
+_soilgrids_rate_limit_lock = threading.Lock()
+
+# Define SoilGrids depth boundaries (cm) and grassland model depths (0-200cm in 10cm steps)
+SOILGRIDS_DEPTH_BOUNDS = np.array(
+    [[0, 5], [5, 15], [15, 30], [30, 60], [60, 100], [100, 200]]
+)
+GMD_DEPTHS_NUMBER = 20
+GMD_DEPTHS_STEP = 10
+
+# Grassland model layer numbers, as written to soil data file
+GMD_LAYER_NUMBERS = np.arange(1, GMD_DEPTHS_NUMBER + 1)
+
+# Overlaps of each grassland model depth (rows) with SoilGrids depths (columns), and overlap counts
+GMD_DEPTH_STARTS = np.arange(GMD_DEPTHS_NUMBER) * GMD_DEPTHS_STEP
+DEPTH_OVERLAPS = (GMD_DEPTH_STARTS[:, np.newaxis] < SOILGRIDS_DEPTH_BOUNDS[:, 1]) & (
+    SOILGRIDS_DEPTH_BOUNDS[:, 0] < GMD_DEPTH_STARTS[:, np.newaxis] + GMD_DEPTHS_STEP
+)
+DEPTH_OVERLAPS_COUNT = DEPTH_OVERLAPS.sum(axis=1)
+
+# HiHydroSoil map URLs already found to exist (not checked again)
+_hihydrosoil_urls_found = set()
+
+# HiHydroSoil map depths (same as SoilGrids depths, HiHydroSoil is derived from SoilGrids)
+HIHYDROSOIL_DEPTHS = SOILGRIDS_DEPTHS
+
+# HiHydroSoil map value for missing data
+HIHYDROSOIL_NODATA = -9999
+
+# Maximum number of HiHydroSoil maps read at the same time
+HIHYDROSOIL_MAX_WORKERS = 8
+
 # Define HiHydroSoil variable specifications, including:
 #     hhs_name: HiHydroSoil variable name.
 #     hhs_unit: HiHydroSoil unit.
@@ -96,6 +167,23 @@ HIHYDROSOIL_SPECS = MappingProxyType(
     }
 )
 
+# Derived HiHydroSoil specifications, in the order of properties in HIHYDROSOIL_SPECS
+HIHYDROSOIL_PROPERTY_NAMES = tuple(HIHYDROSOIL_SPECS)
+HIHYDROSOIL_HHS_NAMES = tuple(specs["hhs_name"] for specs in HIHYDROSOIL_SPECS.values())
+HIHYDROSOIL_HHS_UNITS = tuple(specs["hhs_unit"] for specs in HIHYDROSOIL_SPECS.values())
+HIHYDROSOIL_MAP_TO_FLOAT = np.array(
+    [specs["map_to_float"] for specs in HIHYDROSOIL_SPECS.values()]
+)
+HIHYDROSOIL_CONVERSION_FACTORS = np.array(
+    [specs["hhs_to_gmd"] for specs in HIHYDROSOIL_SPECS.values()]
+)
+HIHYDROSOIL_GMD_UNITS = tuple(specs["gmd_unit"] for specs in HIHYDROSOIL_SPECS.values())
+HIHYDROSOIL_GMD_NAMES = tuple(specs["gmd_name"] for specs in HIHYDROSOIL_SPECS.values())
+
+# Default folder and fixed file name part (after location) of soil data files
+SOIL_DATA_FOLDER = "soilDataPrepared"
+SOIL_DATA_FILE_NAME_END = "__2020__soil"
+
 
 def construct_soil_data_file_name(folder, coordinates, *, file_suffix=".txt"):
     """
@@ -112,7 +200,7 @@ def construct_soil_data_file_name(folder, coordinates, *, file_suffix=".txt"):
     # Get folder with path appropriate for different operating systems
     folder = Path(folder)
 
-    if "lat" in coordinates and "lon" in coordinates:
+    if isinstance(coordinates, dict) and "lat" in coordinates and "lon" in coordinates:
         formatted_lat = f"lat{coordinates['lat']:.6f}"
         formatted_lon = f"lon{coordinates['lon']:.6f}"
         file_start = f"{formatted_lat}_{formatted_lon}"
@@ -125,11 +213,31 @@ def construct_soil_data_file_name(folder, coordinates, *, file_suffix=".txt"):
             logger.error(e)
             raise
 
-    file_name = folder / f"{file_start}__2020__soil{file_suffix}"
+    file_name = folder / f"{file_start}{SOIL_DATA_FILE_NAME_END}{file_suffix}"
 
     return file_name
 
 
+def construct_soil_data_file_names(folder, coordinates_list, *, file_suffix=".txt"):
+    """
+    Construct data file names for multiple locations.
+
+    Parameters:
+        folder (str or Path): Folder where the data files will be stored.
+        coordinates_list (list): List of dictionaries with 'lat' and 'lon' keys ({'lat': float, 'lon': float}).
+        file_suffix (str): File suffix (default is '.txt').
+
+    Returns:
+        list: Constructed data file names as Path objects.
+    """
+    folder = Path(folder)
+
+    return [
+        construct_soil_data_file_name(folder, coordinates, file_suffix=file_suffix)
+        for coordinates in coordinates_list
+    ]
+
+
 def shape_soildata_for_file(array):
     """
     Reshape a 1D array to 2D or transpose a 2D array.
@@ -138,15 +246,15 @@ def shape_soildata_for_file(array):
         array (numpy.ndarray): Input array.
 
     Returns:
-        numpy.ndarray: Reshaped or transposed array.
+        numpy.ndarray: Reshaped or transposed array (view without copying data, may be non-contiguous).
 
     Raises:
         ValueError: If the input array is not 1D or 2D.
     """
     if array.ndim == 1:
-        return array.reshape(1, -1)
+        return array[np.newaxis, :]
     elif array.ndim == 2:
-        return np.transpose(array)
+        return array.T
     else:
         try:
             raise ValueError("Input array must be 1D or 2D.")
@@ -155,6 +263,23 @@ def shape_soildata_for_file(array):
             raise
 
 
+def format_soildata_block(array, header):
+    """
+    Format a 2D array as text block with header line, tab-separated values with 4 decimals.
+
+    Parameters:
+        array (numpy.ndarray): 2D array, one text line per row.
+        header (str): Header line.
+
+    Returns:
+        str: Text block, each line terminated by newline.
+    """
+    lines = [header]
+    lines.extend("\t".join(f"{value:.4f}" for value in row) for row in array.tolist())
+
+    return "\n".join(lines) + "\n"
+
+
 def configure_soilgrids_request(coordinates, property_names):
     """
     Configure a request for SoilGrids API based on given coordinates and properties.
@@ -167,13 +292,13 @@ def configure_soilgrids_request(coordinates, property_names):
         dict: Request configuration including URL and parameters.
     """
     return {
-        "url": "https://rest.isric.org/soilgrids/v2.0/properties/query",
+        "url": SOILGRIDS_URL,
         "params": {
             "lon": coordinates["lon"],
             "lat": coordinates["lat"],
             "property": property_names,
-            "depth": ["0-5cm", "5-15cm", "15-30cm", "30-60cm", "60-100cm", "100-200cm"],
-            "value": ["mean"],
+            "depth": SOILGRIDS_DEPTHS,
+            "value": SOILGRIDS_VALUES,
         },
     }
 
@@ -183,42 +308,289 @@ def configure_soilgrids_request(coordinates, property_names):
     # "value": ["Q0.05", "Q0.5", "Q0.95", "mean", "uncertainty"]
 
 
-def download_soilgrids(request, attempts=6, delay_exponential=8, delay_linear=2):
+def get_soilgrids_request_key(request):
+    """
+    Get unique key for a SoilGrids request, from request URL and sorted parameters.
+    Coordinates are rounded and property names sorted, so that equivalent requests share the key.
+
+    Parameters:
+        request (dict): Dictionary containing the request URL (key: 'url') and parameters (key: 'params').
+
+    Returns:
+        str: Request key.
+    """
+    params = dict(request["params"])
+
+    for coordinate in ("lat", "lon"):
+        if coordinate in params:
+            # (as Python float, numpy numbers are not JSON serializable)
+            params[coordinate] = round(
+                float(params[coordinate]), SOILGRIDS_KEY_DECIMALS
+            )
+
+    if "property" in params:
+        params["property"] = sorted(params["property"])
+
+    return json.dumps({"url": request["url"], "params": params}, sort_keys=True)
+
+
+def get_soilgrids_cache_file(request, cache):
+    """
+    Get cache file for a SoilGrids request, named by hash of request URL and parameters.
+
+    Parameters:
+        request (dict): Dictionary containing the request URL (key: 'url') and parameters (key: 'params').
+        cache (str or Path): Path for local SoilGrids cache directory.
+
+    Returns:
+        Path: Cache file path (.json).
+    """
+    request_key = get_soilgrids_request_key(request)
+    file_stem = hashlib.sha1(request_key.encode("utf-8")).hexdigest()
+
+    return Path(cache) / f"{file_stem}.json"
+
+
+def write_soilgrids_cache_file(cache_file, soilgrids_data, time_stamp):
+    """
+    Write SoilGrids data to cache file atomically (complete file or none, also with concurrent writers).
+
+    Parameters:
+        cache_file (Path): Cache file path (.json).
+        soilgrids_data (dict): SoilGrids data.
+        time_stamp (str): Time stamp of download.
+    """
+    temp_file = None
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to temporary file in same directory, then replace cache file in one step
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=cache_file.parent,
+            prefix=cache_file.stem,
+            suffix=".tmp",
+            delete=False,
+        ) as f:
+            temp_file = Path(f.name)
+            json.dump({"data": soilgrids_data, "time_stamp": time_stamp}, f)
+
+        os.replace(temp_file, cache_file)
+    except OSError as e:
+        # Cache is optional, keep downloaded data anyway
+        logger.warning(f"Cache file '{cache_file}' could not be written (Error {e}).")
+
+        if temp_file is not None:
+            temp_file.unlink(missing_ok=True)
+
+
+def remember_soilgrids_data(request_key, soilgrids_data, time_stamp):
+    """
+    Store SoilGrids response in in-memory cache, dropping least recently used responses if cache is full.
+
+    Parameters:
+        request_key (str): Request key.
+        soilgrids_data (dict): SoilGrids data (JSON response).
+        time_stamp (str): Time stamp of download.
+    """
+    with _soilgrids_memory_cache_lock:
+        _soilgrids_memory_cache[request_key] = (soilgrids_data, time_stamp)
+        _soilgrids_memory_cache.move_to_end(request_key)
+
+        while len(_soilgrids_memory_cache) > SOILGRIDS_MEMORY_CACHE_SIZE:
+            _soilgrids_memory_cache.popitem(last=False)
+
+
+def get_retry_after(response):
+    """
+    Get delay requested by the server via 'Retry-After' header (in seconds).
+
+    Parameters:
+        response (requests.Response): HTTP response.
+
+    Returns:
+        float: Requested delay in seconds (0 if header missing or not a number of seconds).
+    """
+    try:
+        return max(float(response.headers.get("Retry-After", 0)), 0.0)
+    except ValueError:
+        # HTTP date format is not used by SoilGrids, ignore
+        return 0.0
+
+
+def wait_for_soilgrids_rate_limit():
+    """
+    Wait until a SoilGrids request is allowed (in any thread), i.e. after a delay set due to a rate limit error,
+    and with at most SOILGRIDS_REQUESTS_PER_MINUTE requests within any 60 seconds.
+    """
+    request_time = None
+
+    while True:
+        with _soilgrids_rate_limit_lock:
+            if request_time is not None:
+                if _soilgrids_rate_limit["next_request_time"] <= request_time:
+                    return
+
+                # Delay extended while sleeping (rate limit error in other thread), reserve again
+                try:
+                    _soilgrids_request_times.remove(request_time)
+                except ValueError:
+                    pass
+
+            now = time.monotonic()
+            request_time = max(now, _soilgrids_rate_limit["next_request_time"])
+
+            if SOILGRIDS_REQUESTS_PER_MINUTE:
+                # Forget requests older than 60 seconds, wait for oldest remaining one if limit reached
+                while (
+                    _soilgrids_request_times and _soilgrids_request_times[0] <= now - 60
+                ):
+                    _soilgrids_request_times.popleft()
+
+                # (requests are served in order of reservation, keeping reserved times sorted)
+                if _soilgrids_request_times:
+                    request_time = max(request_time, _soilgrids_request_times[-1])
+
+                if len(_soilgrids_request_times) >= SOILGRIDS_REQUESTS_PER_MINUTE:
+                    request_time = max(
+                        request_time,
+                        _soilgrids_request_times[-SOILGRIDS_REQUESTS_PER_MINUTE] + 60,
+                    )
+
+                # Reserve time of this request, so that other threads plan with it
+                _soilgrids_request_times.append(request_time)
+
+        # Sleep without holding the lock, so that other threads can check or extend the delay,
+        # then check again whether the delay was extended in the meantime
+        wait_time = request_time - now
+
+        if wait_time > 0:
+            logger.info(f"Waiting {wait_time:.1f} seconds for SoilGrids rate limit ...")
+            time.sleep(wait_time)
+
+
+def delay_soilgrids_requests(delay):
+    """
+    Delay all further SoilGrids requests (in any thread) after a rate limit error.
+
+    Parameters:
+        delay (float): Delay in seconds from now (an already longer delay is kept).
+    """
+    with _soilgrids_rate_limit_lock:
+        _soilgrids_rate_limit["next_request_time"] = max(
+            _soilgrids_rate_limit["next_request_time"], time.monotonic() + delay
+        )
+
+
+def download_soilgrids(
+    request,
+    attempts=6,
+    delay_exponential=8,
+    delay_linear=2,
+    *,
+    cache=None,
+    session=None,
+    timeout=(5, 60),
+):
     """
     Download data from SoilGrids REST API with retry functionality.
 
     Parameters:
         request (dict): Dictionary containing the request URL (key: 'url') and parameters (key: 'params').
         attempts (int): Total number of attempts (including the initial try). Default is 6.
-        delay_exponential (int): Initial delay in seconds for request rate limit errors (default is 8).
+        delay_exponential (int): Initial delay in seconds for request rate limit errors, doubled for each
+            further rate limit error and randomly shortened by up to half (default is 8).
         delay_linear (int): Delay in seconds for gateway errors and other failed requests (default is 2).
+        cache (Path): Path for local SoilGrids cache directory (optional, responses are read from and written
+            to cache if provided).
+        session (requests.Session): HTTP session to use (default is None, session of current thread is used).
+        timeout (tuple): Connect and read timeouts in seconds (default is (5, 60)).
 
     Returns:
-        tuple: JSON response data (dict) and time stamp.
+        tuple: JSON response data (dict) and time stamp (of original download if read from cache).
 
     Raises:
         Exception: If the download fails after all attempts, raises an exception with the error message and status code.
     """
+    # Responses already obtained in this process are reused
+    request_key = get_soilgrids_request_key(request)
+
+    with _soilgrids_memory_cache_lock:
+        if request_key in _soilgrids_memory_cache:
+            _soilgrids_memory_cache.move_to_end(request_key)
+            logger.info("SoilGrids data reused from previous download.")
+
+            return _soilgrids_memory_cache[request_key]
+
+    if cache is not None:
+        cache_file = get_soilgrids_cache_file(request, cache)
+
+        if cache_file.is_file():
+            try:
+                cached = json_loads(cache_file.read_bytes())
+                remember_soilgrids_data(
+                    request_key, cached["data"], cached["time_stamp"]
+                )
+                logger.info(f"SoilGrids data read from cache file '{cache_file}'.")
+
+                return cached["data"], cached["time_stamp"]
+            except (ValueError, KeyError, TypeError, OSError) as e:
+                # Cache is optional, download again if file is unreadable or has unexpected content
+                logger.warning(
+                    f"Cache file '{cache_file}' could not be read (Error {e})."
+                )
+
     logger.info(f"SoilGrids REST API download from {request['url']} ... ")
+
+    if session is None:
+        session = ut.get_http_session()
+
     status_codes_rate = {429}  # codes for retry with exponentially increasing delay
     status_codes_gateway = {502, 503, 504}  # codes for retry with fixed time delay
 
+    # Exponential delays for rate limit errors, with random jitter so that concurrent retries spread out
+    rate_limit_delays = [
+        random.uniform(0.5, 1.0) * delay_exponential * 2**retry
+        for retry in range(attempts)
+    ]
+    rate_limit_retries = 0
+
     while attempts > 0:
         attempts -= 1
+        wait_for_soilgrids_rate_limit()
         time_stamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
 
         try:
-            response = requests.get(request["url"], params=request["params"])
+            response = session.get(
+                request["url"],
+                params=request["params"],
+                headers={"Accept": "application/json"},
+                timeout=timeout,
+            )
 
             if response.status_code == 200:
-                return response.json(), time_stamp
+                soilgrids_data = json_loads(response.content)
+
+                if cache is not None:
+                    write_soilgrids_cache_file(cache_file, soilgrids_data, time_stamp)
+
+                remember_soilgrids_data(request_key, soilgrids_data, time_stamp)
+
+                return soilgrids_data, time_stamp
             elif response.status_code in status_codes_rate:
                 logger.error(f"Request rate limited (Error {response.status_code}).")
 
                 if attempts > 0:
-                    logger.info(f"Retrying in {delay_exponential} seconds ...")
-                    time.sleep(delay_exponential)
-                    delay_exponential *= 2
+                    # Rate limit applies to all requests, so delay them in all threads
+                    delay = max(
+                        rate_limit_delays[rate_limit_retries],
+                        get_retry_after(response),
+                    )
+                    rate_limit_retries += 1
+                    logger.info(f"Retrying in {delay:.1f} seconds ...")
+                    delay_soilgrids_requests(delay)
             elif response.status_code in status_codes_gateway:
                 logger.error(f"Request failed (Error {response.status_code}).")
 
@@ -253,32 +625,51 @@ def get_soilgrids_data(soilgrids_data, property_names):
     """
     logger.info("Reading SoilGrids data ...")
 
-    # Initialize property_data array with zeros
+    # Initialize property_data array with nan, one column per requested SoilGrids depth
+    # (independent of the depths contained in the response, e.g. no layers at all)
     property_data = np.full(
-        (len(property_names), len(soilgrids_data["properties"]["layers"][0]["depths"])),
-        np.nan,
-        dtype=float,
+        (len(property_names), len(SOILGRIDS_DEPTHS)), np.nan, dtype=float
     )
 
-    # Iterate through property_names
+    # Look up properties by name (instead of searching all layers for each property)
+    layers_by_name = {
+        prop["name"]: prop for prop in soilgrids_data["properties"]["layers"]
+    }
+
+    # Fill property_data array with one row per property (missing or zero mean values remain nan)
+    # (log lines are only formatted if logged)
+    log_enabled = logger.isEnabledFor(logging.INFO)
+    log_lines = []
+
     for p_index, p_name in enumerate(property_names):
-        # Find the corresponding property in soilgrids_data
-        for prop in soilgrids_data["properties"]["layers"]:
-            if prop["name"] == p_name:
-                p_units = prop["unit_measure"]["target_units"]
-
-                # Iterate through depths and fill the property_data array
-                for d_index, depth in enumerate(prop["depths"]):
-                    if depth["values"]["mean"]:
-                        property_data[p_index, d_index] = (
-                            depth["values"]["mean"] / prop["unit_measure"]["d_factor"]
-                        )
-
-                    logger.info(
-                        f"Depth {depth['label']}, {p_name} "
-                        f"mean: {property_data[p_index, d_index]} {p_units}"
-                    )
-                break  # Stop searching once the correct property is found
+        prop = layers_by_name.get(p_name)
+
+        if prop is None:
+            continue
+
+        # Place values by depth label (depths not requested are ignored)
+        depths = [
+            depth
+            for depth in prop["depths"]
+            if depth["label"] in SOILGRIDS_DEPTH_INDICES
+        ]
+        d_indices = [SOILGRIDS_DEPTH_INDICES[depth["label"]] for depth in depths]
+        means = np.fromiter(
+            (depth["values"]["mean"] or np.nan for depth in depths),
+            dtype=float,
+            count=len(depths),
+        )
+        property_data[p_index, d_indices] = means / prop["unit_measure"]["d_factor"]
+
+        if log_enabled:
+            p_units = prop["unit_measure"]["target_units"]
+            log_lines.extend(
+                f"Depth {depth['label']}, {p_name} mean: {value} {p_units}"
+                for depth, value in zip(depths, property_data[p_index, d_indices])
+            )
+
+    if log_lines:
+        logger.info("\n".join(log_lines))
 
     return property_data
 
@@ -306,9 +697,14 @@ def get_hihydrosoil_map_file(property_name, depth, *, cache=None):
             logger.error(f"Local file '{map_file}' not found!")
             logger.info("Trying to access via URL ...")
 
-    map_file = "http://opendap.biodt.eu/grasslands-pdt/soilMapsHiHydroSoil/" + file_name
+    map_file = HIHYDROSOIL_URL + file_name
+
+    if map_file in _hihydrosoil_urls_found:
+        return map_file
 
     if ut.check_url(map_file):
+        _hihydrosoil_urls_found.add(map_file)
+
         return map_file
     else:
         logger.error(f"File '{map_file}' not found!")
@@ -316,6 +712,33 @@ def get_hihydrosoil_map_file(property_name, depth, *, cache=None):
         return None
 
 
+def read_hihydrosoil_map(property_name, depth, coordinates_list, *, cache=None):
+    """
+    Read values of one HiHydroSoil map at multiple coordinates.
+
+    Parameters:
+        property_name (str): Name of the soil property (e.g. 'WCpF4.2' or 'Ksat').
+        depth (str): Depth layer (one of '0-5cm', '5-15cm', '15-30cm', '30-60cm', '60-100cm', '100-200cm').
+        coordinates_list (list): List of dictionaries with 'lat' and 'lon' keys ({'lat': float, 'lon': float}).
+        cache (Path): Path for local HiHydroSoil map directory (optional).
+
+    Returns:
+        tuple: Map file path or URL (None if not found), extracted values (numpy.ndarray, nan for no-data
+            values, None if extraction failed), and time stamp (None if map not found).
+    """
+    map_file = get_hihydrosoil_map_file(property_name, depth, cache=cache)
+
+    if not map_file:
+        return None, None, None
+
+    logger.info(f"Reading from file '{map_file}' ...")
+    values, time_stamp = ut.extract_raster_values(
+        map_file, coordinates_list, nodata_to_nan=True
+    )
+
+    return map_file, values, time_stamp
+
+
 def get_hihydrosoil_data(coordinates, *, cache=None):
     """
     Read HiHydroSoil data for the given coordinates and return as array.
@@ -329,40 +752,88 @@ def get_hihydrosoil_data(coordinates, *, cache=None):
         - Property data for various soil properties and depths (2D numpy.ndarray, nan if no data found),
         - List of query sources and time stamps.
     """
+    property_data, query_protocol = get_hihydrosoil_data_batch(
+        [coordinates], cache=cache
+    )
+
+    return property_data[:, :, 0], query_protocol
+
+
+def get_hihydrosoil_data_batch(coordinates_list, *, cache=None):
+    """
+    Read HiHydroSoil data for multiple coordinates and return as array, opening each map file only once.
+
+    Parameters:
+        coordinates_list (list): List of dictionaries with 'lat' and 'lon' keys ({'lat': float, 'lon': float}).
+        cache (Path): Path for local HiHydroSoil map directory (optional).
+
+    Returns:
+        tuple:
+        - Property data for various soil properties, depths and coordinates (3D numpy.ndarray, nan if no data found),
+        - List of query sources and time stamps.
+    """
     logger.info("Reading HiHydroSoil data ...")
-    hhs_depths = ["0-5cm", "5-15cm", "15-30cm", "30-60cm", "60-100cm", "100-200cm"]
 
-    # Initialize property_data array with zeros
+    # Initialize property_data array with nan
     property_data = np.full(
-        (len(HIHYDROSOIL_SPECS), len(hhs_depths)), np.nan, dtype=float
+        (len(HIHYDROSOIL_SPECS), len(HIHYDROSOIL_DEPTHS), len(coordinates_list)),
+        np.nan,
+        dtype=float,
     )
 
-    # Extract values from tif maps for each property and depth
+    # Extract values from tif maps for each property and depth, reading several maps at the same time
+    # (maps are independent, results are collected in the original order)
+    tasks = [
+        (p_index, d_index, hhs_name, depth)
+        for p_index, hhs_name in enumerate(HIHYDROSOIL_HHS_NAMES)
+        for d_index, depth in enumerate(HIHYDROSOIL_DEPTHS)
+    ]
+
+    executor = ut.get_thread_pool("hihydrosoil", HIHYDROSOIL_MAX_WORKERS)
+    futures = [
+        executor.submit(
+            read_hihydrosoil_map, hhs_name, depth, coordinates_list, cache=cache
+        )
+        for _, _, hhs_name, depth in tasks
+    ]
     query_protocol = []
 
-    for p_index, (p_name, p_specs) in enumerate(HIHYDROSOIL_SPECS.items()):
-        for d_index, depth in enumerate(hhs_depths):
-            map_file = get_hihydrosoil_map_file(p_specs["hhs_name"], depth, cache=cache)
+    for (p_index, d_index, _, _), future in zip(tasks, futures):
+        map_file, values, time_stamp = future.result()
+
+        if map_file:
+            query_protocol.append([map_file, time_stamp])
 
-            if map_file:
-                # Extract and convert value
-                logger.info(f"Reading from file '{map_file}' ...")
-                value, time_stamp = ut.extract_raster_value(map_file, coordinates)
-                query_protocol.append([map_file, time_stamp])
+            if values is not None:
+                property_data[p_index, d_index] = values
 
-                if value != -9999:
-                    property_data[p_index, d_index] = value * p_specs["map_to_float"]
+    # Set remaining no-data values to nan (maps without no-data value in metadata),
+    # convert map values to actual float numbers for all properties at once
+    property_data[property_data == HIHYDROSOIL_NODATA] = np.nan
+    property_data *= HIHYDROSOIL_MAP_TO_FLOAT[:, np.newaxis, np.newaxis]
 
-            logger.info(
+    # Log all values in one message (formatted only if logged)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "\n".join(
                 f"Depth {depth}, {p_name}: "
-                f"{property_data[p_index, d_index]:.4f} {p_specs['hhs_unit']}"
+                + ", ".join(f"{value:.4f}" for value in property_data[p_index, d_index])
+                + f" {HIHYDROSOIL_HHS_UNITS[p_index]}"
+                for p_index, p_name in enumerate(HIHYDROSOIL_PROPERTY_NAMES)
+                for d_index, depth in enumerate(HIHYDROSOIL_DEPTHS)
             )
+        )
 
     return property_data, query_protocol
 
 
 def map_depths_soilgrids_grassland_model(
-    property_data, property_names, conversion_factor=1, conversion_units=None
+    property_data,
+    property_names,
+    conversion_factor=1,
+    conversion_units=None,
+    *,
+    out=None,
 ):
     """
     Map data from SoilGrids depths to grassland model depths.
@@ -372,64 +843,55 @@ def map_depths_soilgrids_grassland_model(
         property_names (list): List of property names.
         conversion_factor (float or array): Conversion factors to apply to the values (default is 1).
         conversion_units (list, optional): List of units after conversion for each property (default is 'None').
+        out (numpy.ndarray, optional): Array (properties x grassland model depths) to store the mapped values in,
+            can be a transposed view of an array in file layout (default is None, new array is created).
 
     Returns:
         numpy.ndarray: Array containing mapped property values.
     """
     logger.info("Mapping data from SoilGrids depths to grassland model depths ...")
 
-    # Define number of new depths, 0-200cm in 10cm steps
-    new_depths_number = 20
-    new_depths_step = 10
-
-    # Define SoilGrids depths boundaries
-    old_depths = np.array([[0, 5], [5, 15], [15, 30], [30, 60], [60, 100], [100, 200]])
-
-    # Prepare conversion factors and units
-    if isinstance(conversion_factor, float):
-        conversion_factor = np.full((len(property_names),), conversion_factor)
+    # Prepare conversion factors (scalar applies to all properties, otherwise one factor per property row)
+    if np.ndim(conversion_factor) == 0:
+        conversion_factors = conversion_factor
     else:
-        conversion_factor = np.array(conversion_factor)
+        conversion_factors = np.asarray(conversion_factor).reshape(-1, 1)
 
     if conversion_units is None:
         conversion_units = [""] * len(property_names)
 
-    # Initialize array to store mapped mean values
-    if property_data.ndim == 1:
-        data_to_map = property_data.copy().reshape(1, -1)
-    else:
-        data_to_map = property_data
-
-    mapped_data = np.zeros((data_to_map.shape[0], new_depths_number), dtype=float)
-
-    # Iterate over each 10cm interval
-    for d_new in range(new_depths_number):
-        start_depth = d_new * new_depths_step
-        end_depth = (d_new + 1) * new_depths_step
+    # Prepare data to map as 2D array (view for 1D data)
+    data_to_map = np.atleast_2d(property_data)
 
-        # Find the indices of SoilGrid depths within the new 10cm interval
-        d_indices = np.where(
-            (start_depth < old_depths[:, 1]) & (old_depths[:, 0] < end_depth)
-        )[0]
-
-        # For each property, calculate the mean of old values (1 or 2 values) for the new 10cm interval
-        mapped_data[:, d_new] = (
-            np.mean(data_to_map[:, d_indices], axis=1) * conversion_factor
-        )
-        log_message = f"Depth {start_depth}-{end_depth}cm"
+    # For all properties and 10cm intervals, calculate the mean of overlapping old values (1 or 2 values)
+    # (values of non-overlapping depths are excluded by np.where, so that nan values stay local)
+    mapped_data = np.multiply(
+        np.where(DEPTH_OVERLAPS, data_to_map[:, np.newaxis, :], 0).sum(axis=2)
+        / DEPTH_OVERLAPS_COUNT,
+        conversion_factors,
+        out=out,
+    )
 
-        for p_index in range(len(property_names)):
-            log_message += (
-                f", {property_names[p_index]}: "
-                f"{mapped_data[p_index, d_new]:.4f} {conversion_units[p_index]}"
+    # Log all mapped values in one message (formatted only if logged)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "\n".join(
+                f"Depth {start_depth}-{start_depth + GMD_DEPTHS_STEP}cm"
+                + "".join(
+                    f", {property_names[p_index]}: "
+                    f"{mapped_data[p_index, d_new]:.4f} {conversion_units[p_index]}"
+                    for p_index in range(len(property_names))
+                )
+                for d_new, start_depth in enumerate(GMD_DEPTH_STARTS)
             )
-
-        logger.info(log_message)
+        )
 
     return mapped_data
 
 
-def get_property_means(property_data, property_names, property_units=None):
+def get_property_means(
+    property_data, property_names, property_units=None, *, out=None, verbose=True
+):
     """
     Calculate property data means over all depths (equal weight for each depth).
 
@@ -437,20 +899,26 @@ def get_property_means(property_data, property_names, property_units=None):
         property_data (numpy.ndarray): Array containing property data.
         property_names (list): List of property names.
         property_units (list, optional): List of units for each property (default is 'None').
+        out (numpy.ndarray, optional): Array to store the means in, e.g. reused for many locations
+            (default is None, new array is created).
+        verbose (bool): Log the means of each property (default is True).
 
     Returns:
         numpy.ndarray: Array containing property means.
     """
-    logger.info("Averaging data over all depths ...")
-    property_means = np.mean(property_data, axis=1)
+    property_means = np.mean(property_data, axis=1, out=out)
 
-    if property_units is None:
-        property_units = [""] * len(property_names)
+    if verbose and logger.isEnabledFor(logging.INFO):
+        if property_units is None:
+            property_units = [""] * len(property_names)
 
-    for p_index in range(len(property_names)):
         logger.info(
-            f"Depth 0-200cm, {property_names[p_index]} "
-            f"mean: {property_means[p_index]:.4f} {property_units[p_index]}"
+            "Averaging data over all depths ...\n"
+            + "\n".join(
+                f"Depth 0-200cm, {property_names[p_index]} "
+                f"mean: {property_means[p_index]:.4f} {property_units[p_index]}"
+                for p_index in range(len(property_names))
+            )
         )
 
     return property_means
@@ -463,7 +931,6 @@ def soil_data_to_txt_file(
     hihydrosoil_data,
     data_query_protocol,
     file_name=None,
-    # nitrogen_data,
 ):
     """
     Write SoilGrids and HiHydroSoil data to soil data TXT file in grassland model format.
@@ -493,56 +960,43 @@ def soil_data_to_txt_file(
         composition_data_gmd, composition_property_names
     )
 
-    # Prepare HiHydroSoil data in grassland model format
-    hhs_property_names = list(HIHYDROSOIL_SPECS.keys())
-    hhs_conversion_factor = [
-        specs["hhs_to_gmd"] for specs in HIHYDROSOIL_SPECS.values()
-    ]
-    hhs_units_gmd = [specs["gmd_unit"] for specs in HIHYDROSOIL_SPECS.values()]
-    hhs_data_gmd = map_depths_soilgrids_grassland_model(
-        hihydrosoil_data, hhs_property_names, hhs_conversion_factor, hhs_units_gmd
+    # Prepare HiHydroSoil data in grassland model format, mapped directly into the
+    # layout written to file (one row per depth: layer number and properties)
+    hhs_block = np.empty((GMD_DEPTHS_NUMBER, len(HIHYDROSOIL_PROPERTY_NAMES) + 1))
+    hhs_block[:, 0] = GMD_LAYER_NUMBERS
+    map_depths_soilgrids_grassland_model(
+        hihydrosoil_data,
+        HIHYDROSOIL_PROPERTY_NAMES,
+        HIHYDROSOIL_CONVERSION_FACTORS,
+        HIHYDROSOIL_GMD_UNITS,
+        out=hhs_block[:, 1:].T,
     )
 
     # Write collected soil data to TXT file
-    if not file_name:
-        file_name = construct_soil_data_file_name("soilDataPrepared", coordinates)
+    if file_name:
+        file_name = Path(file_name)
+    else:
+        file_name = construct_soil_data_file_name(SOIL_DATA_FOLDER, coordinates)
 
     # Create data directory if missing
-    Path(file_name).parent.mkdir(parents=True, exist_ok=True)
+    file_name.parent.mkdir(parents=True, exist_ok=True)
 
     # SoilGrids composition part
     composition_data_to_write = shape_soildata_for_file(composition_data_mean)
     composition_header = "\t".join(
         list(map(str.capitalize, composition_property_names))
     )
-    np.savetxt(
-        file_name,
-        composition_data_to_write,
-        delimiter="\t",
-        fmt="%.4f",
-        header=composition_header,
-        comments="",
-    )
 
     # HiHydroSoil part
-    hhs_data_to_write = shape_soildata_for_file(hhs_data_gmd)
-    gmd_depth_count = np.arange(1, 21).reshape(-1, 1)
-    hhs_data_to_write = np.concatenate(
-        (gmd_depth_count, hhs_data_to_write[:, :2], hhs_data_to_write[:, 2:4]), axis=1
+    hhs_header = "\t".join(("Layer",) + HIHYDROSOIL_GMD_NAMES)
+
+    # Format both parts in memory and write them at once (same encoding and line ends as np.savetxt)
+    soil_data_text = (
+        format_soildata_block(composition_data_to_write, composition_header)
+        + "\n"
+        + format_soildata_block(hhs_block, hhs_header)
     )
-    gmd_names = [specs["gmd_name"] for specs in HIHYDROSOIL_SPECS.values()]
-    hhs_header = "\t".join(map(str, ["Layer"] + gmd_names))
-
-    with open(file_name, "a", encoding="utf-8", errors="replace") as fh:
-        fh.write("\n")
-        np.savetxt(
-            fh,
-            hhs_data_to_write,
-            delimiter="\t",
-            fmt="%.4f",
-            header=hhs_header,
-            comments="",
-        )
+    file_name.write_bytes(soil_data_text.encode("latin-1"))
 
     logger.info(
         f"Processed soil data from SoilGrids and HiHydroSoil written to file '{file_name}'."
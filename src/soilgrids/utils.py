@@ -24,49 +24,168 @@ Science Ltd., Finland and the LUMI consortium through a EuroHPC Development Acce
 """
 
 import csv
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime, timezone
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
+from types import MappingProxyType
 
-import pandas as pd
-import pyproj
-import rasterio
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 
 from soilgrids.logger_config import logger
 
+# GDAL configuration for reading raster files:
+#     GDAL_CACHEMAX: Block cache size in MB, keeps blocks of repeatedly read files in memory.
+#     GDAL_DISABLE_READDIR_ON_OPEN: Do not list directory of opened file (avoids extra requests for URLs).
+#     CPL_VSIL_CURL_CHUNK_SIZE: Size of HTTP range requests in bytes (fewer, larger requests for URLs).
+#     VSI_CACHE, VSI_CACHE_SIZE: Keep downloaded bytes of opened URLs in memory (size in bytes per file).
+GDAL_CONFIG = MappingProxyType(
+    {
+        "GDAL_CACHEMAX": 512,
+        "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+        "CPL_VSIL_CURL_CHUNK_SIZE": 1 << 20,
+        "VSI_CACHE": "TRUE",
+        "VSI_CACHE_SIZE": 64 << 20,
+    }
+)
+
+# Maximum number of pixels of a raster window read at once for points close to each other
+# (about 1 MB for 4-byte values, larger areas are sampled pixel by pixel)
+RASTER_WINDOW_MAX_PIXELS = 512 * 512
+
+# Maximum ratio of blocks (tiles or strips) covered by a raster window to blocks containing points
+# (window reads only if not many more blocks are decompressed/downloaded than by sampling pixels)
+RASTER_WINDOW_MAX_BLOCK_RATIO = 2
+
+# Buffer size (bytes) for writing text files, fewer write calls for long lists
+FILE_WRITE_BUFFER_SIZE = 1 << 20
+
+# HTTP sessions, one per thread (requests.Session is not guaranteed to be thread-safe)
+_http_sessions = threading.local()
+
+# Thread pools kept for the whole process (threads, and their HTTP sessions with open
+# connections, are reused by later calls)
+_thread_pools = {}
+_thread_pools_lock = threading.Lock()
+
+
+def get_http_session():
+    """
+    Get HTTP session of the current thread, create it on first use.
 
-def reproject_coordinates(lat, lon, target_crs):
+    Returns:
+        requests.Session: Session with connection pool, reusing connections (keep-alive) for repeated requests.
     """
-    Reproject latitude and longitude coordinates to a target CRS.
+    session = getattr(_http_sessions, "session", None)
+
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _http_sessions.session = session
+
+    return session
+
+
+def get_thread_pool(name, max_workers):
+    """
+    Get thread pool for a kind of task, create it on first use and keep it for later calls.
+
+    Parameters:
+        name (str): Name of the kind of task (separate pools, so that tasks of one pool can wait for
+            tasks of another pool).
+        max_workers (int): Maximum number of threads of the pool.
+
+    Returns:
+        concurrent.futures.ThreadPoolExecutor: Thread pool (threads are joined at interpreter exit).
+    """
+    with _thread_pools_lock:
+        key = (name, max_workers)
+
+        if key not in _thread_pools:
+            _thread_pools[key] = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=f"soilgrids-{name}"
+            )
+
+        return _thread_pools[key]
+
+
+@lru_cache(maxsize=64)
+def get_transformer(target_crs):
+    """
+    Get transformer from lat/lon coordinates to a target CRS, created only once per target CRS.
 
     Parameters:
-        lat (float): Latitude.
-        lon (float): Longitude.
         target_crs (str): Target Coordinate Reference System in WKT format.
 
     Returns:
-        tuple (float): Reprojected coordinates (easting, northing).
+        pyproj.Transformer: Transformer from EPSG:4326 (lon, lat order) to target CRS (east, north order).
     """
+    # Import only when needed (loads PROJ library)
+    import pyproj
+
     # Define the source CRS (EPSG:4326 - WGS 84, commonly used for lat/lon)
     src_crs = pyproj.CRS("EPSG:4326")
 
     # Create a transformer to convert from the source CRS to the target CRS
     # (always_xy: use lon/lat for source CRS and east/north for target CRS)
-    transformer = pyproj.Transformer.from_crs(src_crs, target_crs, always_xy=True)
+    # (thread-safe since pyproj 3.1, so cached transformers can be shared)
+    return pyproj.Transformer.from_crs(src_crs, target_crs, always_xy=True)
+
+
+def reproject_coordinates(lat, lon, target_crs):
+    """
+    Reproject latitude and longitude coordinates to a target CRS.
+
+    Parameters:
+        lat (float): Latitude.
+        lon (float): Longitude.
+        target_crs (str): Target Coordinate Reference System in WKT format.
 
+    Returns:
+        tuple (float): Reprojected coordinates (easting, northing).
+    """
     # Reproject the coordinates (order is lon, lat!)
-    east, north = transformer.transform(lon, lat)
+    east, north = get_transformer(target_crs).transform(lon, lat)
 
     return east, north
 
 
+def reproject_coordinates_batch(lats, lons, target_crs):
+    """
+    Reproject multiple latitude and longitude coordinates to a target CRS in one call.
+
+    Parameters:
+        lats (array-like): Latitudes.
+        lons (array-like): Longitudes.
+        target_crs (str): Target Coordinate Reference System in WKT format.
+
+    Returns:
+        tuple (numpy.ndarray): Reprojected coordinates (eastings, northings).
+    """
+    # Reproject the coordinates (order is lon, lat!)
+    easts, norths = get_transformer(target_crs).transform(
+        np.asarray(lons, dtype=float), np.asarray(lats, dtype=float)
+    )
+
+    return easts, norths
+
+
 def extract_raster_value(tif_file, coordinates, *, band_number=1, attempts=5, delay=2):
     """
     Extract value from raster file at specified coordinates.
 
     Parameters:
-        tif_file (str): TIF file path or URL.
+        tif_file (str or rasterio.io.DatasetReader): TIF file path or URL, or already opened dataset.
         coordinates (dict): Dictionary with 'lat' and 'lon' keys ({'lat': float, 'lon': float}).
         band_number (int): Band number for which the value shall be extracted (default is 1).
         attempts (int): Number of attempts to open the TIF file in case of errors (default is 5).
@@ -75,24 +194,65 @@ def extract_raster_value(tif_file, coordinates, *, band_number=1, attempts=5, de
     Returns:
         tuple: Extracted value (None if extraction failed), and time stamp.
     """
+    values, time_stamp = extract_raster_values(
+        tif_file,
+        [coordinates],
+        band_number=band_number,
+        attempts=attempts,
+        delay=delay,
+    )
+
+    return (None if values is None else values[0]), time_stamp
+
+
+def extract_raster_values(
+    tif_file,
+    coordinates_list,
+    *,
+    band_number=1,
+    attempts=5,
+    delay=2,
+    nodata_to_nan=False,
+):
+    """
+    Extract values from raster file at multiple coordinates, opening the file only once.
+
+    Parameters:
+        tif_file (str or rasterio.io.DatasetReader): TIF file path or URL, or already opened dataset
+            (e.g. for repeated calls with the same TIF file).
+        coordinates_list (list): List of dictionaries with 'lat' and 'lon' keys ({'lat': float, 'lon': float}).
+        band_number (int or list): Band number, or list of band numbers read in the same pass,
+            for which the values shall be extracted (default is 1).
+        attempts (int): Number of attempts to open the TIF file in case of errors (default is 5).
+        delay (int): Number of seconds to wait between attempts (default is 2).
+        nodata_to_nan (bool): Replace the no-data value of the TIF file (if defined) by nan (default is False).
+
+    Returns:
+        tuple: Extracted values (numpy.ndarray, one column per band for list of band numbers,
+            None if extraction failed), and time stamp.
+    """
+    # Import only when needed (loads GDAL library)
+    import rasterio
+
+    # Use already opened dataset as is (not closed here), otherwise open TIF file
+    if isinstance(tif_file, rasterio.io.DatasetReader):
+        open_dataset = nullcontext
+    else:
+        open_dataset = rasterio.open
+
     while attempts > 0:
         time_stamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
 
         try:
-            with rasterio.open(tif_file) as src:
-                # Get the target CRS (as str in WKT format) from TIF file
-                target_crs = src.crs.to_wkt()
-                # (HiHydroSoil works with lat/lon too, but better to keep transformation in.)
-
-                # Reproject the coordinates to the target CRS
-                east, north = reproject_coordinates(
-                    coordinates["lat"], coordinates["lon"], target_crs
+            with rasterio.Env(**GDAL_CONFIG), open_dataset(tif_file) as src:
+                values = sample_raster_values(
+                    src,
+                    coordinates_list,
+                    band_number=band_number,
+                    nodata_to_nan=nodata_to_nan,
                 )
 
-                # Extract the value at the specified coordinates
-                value = next(src.sample([(east, north)], indexes=band_number))
-
-            return value[0], time_stamp
+            return values, time_stamp
         except rasterio.errors.RasterioError as e:
             attempts -= 1
             logger.error(f"Reading TIF file failed (Error {e}).")
@@ -104,7 +264,114 @@ def extract_raster_value(tif_file, coordinates, *, band_number=1, attempts=5, de
                 return None, time_stamp
 
 
-def check_url(url, attempts=3, delay=2):
+def sample_raster_values(src, coordinates_list, *, band_number=1, nodata_to_nan=False):
+    """
+    Sample values of an opened raster dataset at multiple coordinates.
+
+    Parameters:
+        src (rasterio.io.DatasetReader): Opened raster dataset.
+        coordinates_list (list): List of dictionaries with 'lat' and 'lon' keys ({'lat': float, 'lon': float}).
+        band_number (int or list): Band number, or list of band numbers, for which the values shall be
+            extracted (default is 1).
+        nodata_to_nan (bool): Replace the no-data values of the dataset bands (if defined) by nan (default is False).
+
+    Returns:
+        numpy.ndarray: Extracted values (one value per coordinates for single band number, array of shape
+            (number of coordinates, number of bands) for list of band numbers).
+    """
+    # Import only when needed (loads GDAL library)
+    import rasterio
+    from rasterio.windows import Window
+
+    # Read all bands in the same pass
+    band_numbers = np.atleast_1d(band_number).tolist()
+    dtype = np.result_type(*(src.dtypes[band - 1] for band in band_numbers))
+
+    if not coordinates_list:
+        return np.empty((0, len(band_numbers)) if np.ndim(band_number) else 0, dtype)
+
+    lats = [coordinates["lat"] for coordinates in coordinates_list]
+    lons = [coordinates["lon"] for coordinates in coordinates_list]
+
+    if src.crs is not None and src.crs.to_epsg() == 4326:
+        # TIF file uses lat/lon already (e.g. HiHydroSoil), no reprojection needed
+        easts = np.asarray(lons, dtype=float)
+        norths = np.asarray(lats, dtype=float)
+    else:
+        # Reproject all coordinates at once to the target CRS (as str in WKT format) from TIF file
+        easts, norths = reproject_coordinates_batch(lats, lons, src.crs.to_wkt())
+
+    # Get pixel indices of all coordinates
+    rows, cols = (
+        np.asarray(indices)
+        for indices in rasterio.transform.rowcol(src.transform, easts, norths)
+    )
+    window = Window(
+        cols.min(),
+        rows.min(),
+        cols.max() - cols.min() + 1,
+        rows.max() - rows.min() + 1,
+    )
+
+    # Number of blocks (tiles or strips) of the TIF file covered by window and containing points
+    block_height, block_width = src.block_shapes[band_numbers[0] - 1]
+    window_blocks = (rows.max() // block_height - rows.min() // block_height + 1) * (
+        cols.max() // block_width - cols.min() // block_width + 1
+    )
+    point_blocks = len(
+        np.unique(np.column_stack((rows // block_height, cols // block_width)), axis=0)
+    )
+
+    if (
+        window.width * window.height <= RASTER_WINDOW_MAX_PIXELS
+        and window_blocks <= RASTER_WINDOW_MAX_BLOCK_RATIO * point_blocks
+        and window.col_off >= 0
+        and window.row_off >= 0
+        and window.col_off + window.width <= src.width
+        and window.row_off + window.height <= src.height
+    ):
+        # Points close to each other (and window not covering many blocks without points, e.g. strips
+        # of full map width): read their bounding window at once
+        window_data = src.read(band_numbers, window=window)
+        values = window_data[:, rows - window.row_off, cols - window.col_off].T
+    else:
+        # Points far apart (or outside of map): read pixels one by one, each pixel only once
+        # (coordinates in the same pixel share one read), sorted by row and column
+        # (neighbouring pixels are read one after another, reusing cached blocks),
+        # then put values back to original order
+        _, first_indices, inverse = np.unique(
+            np.column_stack((rows, cols)),
+            axis=0,
+            return_index=True,
+            return_inverse=True,
+        )
+        pixel_values = np.fromiter(
+            src.sample(
+                zip(easts[first_indices], norths[first_indices]),
+                indexes=band_numbers,
+            ),
+            dtype=(dtype, (len(band_numbers),)),
+            count=len(first_indices),
+        )
+        values = pixel_values[inverse.reshape(-1)]
+
+    if nodata_to_nan:
+        nodata_values = [src.nodatavals[band - 1] for band in band_numbers]
+
+        if any(nodata is not None for nodata in nodata_values):
+            # Compare each band with its own no-data value (nan never matches)
+            nodata_values = np.array(
+                [np.nan if nodata is None else nodata for nodata in nodata_values]
+            )
+            values = np.where(values == nodata_values, np.nan, values)
+
+    if np.ndim(band_number) == 0:
+        values = values[:, 0]
+
+    return values
+
+
+def check_url(url, attempts=3, delay=2, *, session=None, timeout=(5, 30)):
     """
     Check if a file exists at the specified URL and retrieve its content type.
 
@@ -112,6 +379,8 @@ def check_url(url, attempts=3, delay=2):
         url (str): URL to check.
         attempts (int): Number of attempts in case of connection errors or specific status codes (default is 3).
         delay (int): Number of seconds to wait between attempts (default is 2).
+        session (requests.Session): HTTP session to use (default is None, session of current thread is used).
+        timeout (tuple): Connect and read timeouts in seconds (default is (5, 30)).
 
     Returns:
         str: URL if existing (original or redirected), None otherwise.
@@ -119,11 +388,14 @@ def check_url(url, attempts=3, delay=2):
     if not url:
         return None
 
+    if session is None:
+        session = get_http_session()
+
     retry_status_codes = {502, 503, 504}
 
     while attempts > 0:
         try:
-            response = requests.head(url, allow_redirects=True)
+            response = session.head(url, allow_redirects=True, timeout=timeout)
 
             if response.status_code == 200:
                 return response.url
@@ -134,7 +406,7 @@ def check_url(url, attempts=3, delay=2):
                     time.sleep(delay)
             else:
                 return None
-        except requests.ConnectionError:
+        except (requests.ConnectionError, requests.Timeout):
             attempts -= 1
 
             if attempts > 0:
@@ -143,31 +415,72 @@ def check_url(url, attempts=3, delay=2):
     return None
 
 
-def list_to_file(list_to_write, file_name, *, column_names=None):
+def check_urls(urls, attempts=3, delay=2, *, max_workers=16, timeout=(5, 30)):
+    """
+    Check multiple URLs concurrently (network latencies overlap in threads).
+
+    Parameters:
+        urls (list): URLs to check.
+        attempts (int): Number of attempts per URL in case of connection errors or specific status codes (default is 3).
+        delay (int): Number of seconds to wait between attempts (default is 2).
+        max_workers (int): Maximum number of URLs checked at the same time (default is 16).
+        timeout (tuple): Connect and read timeouts in seconds (default is (5, 30)).
+
+    Returns:
+        list: URL if existing (original or redirected), None otherwise, for each URL in input order.
+    """
+    executor = get_thread_pool("check_urls", max_workers)
+
+    return list(
+        executor.map(lambda url: check_url(url, attempts, delay, timeout=timeout), urls)
+    )
+
+
+def list_to_file(
+    list_to_write, file_name, *, column_names=None, chunk_size=None, schema=None
+):
     """
-    Write a list to a text file (tab-separated) or csv file (;-separated) or an Excel file.
+    Write a list to a text file (tab-separated) or csv file (;-separated) or an Excel file
+    or a Parquet or Feather file.
 
     Parameters:
         list_to_write (list): List of strings or tuples or dictionaries to be written to the file.
         file_name (str or Path): Path of output file (suffix determines file type).
         column_names (list): List of column names (strings) to write as header line (default is None).
+        chunk_size (int): Number of rows converted and written at once for Parquet or Feather files
+            (default is None, all rows at once).
+        schema (pyarrow.Schema): Column names and types for Parquet or Feather files written in chunks
+            (default is None, types obtained from first value of each column that is not None).
     """
+    if chunk_size is not None and chunk_size < 1:
+        try:
+            raise ValueError("Chunk size must be a positive number of rows.")
+        except ValueError as e:
+            logger.error(e)
+            raise
+
+    file_path = Path(file_name)
+    file_suffix = file_path.suffix.lower()
+
     # Convert string entries to single item tuples
     list_to_write = [
         (entry,) if isinstance(entry, str) else entry for entry in list_to_write
     ]
 
-    # Check if list_to_write contains dictionaries
-    if any(isinstance(entry, dict) for entry in list_to_write):
-        if not all(isinstance(entry, dict) for entry in list_to_write):
-            try:
-                raise ValueError(
-                    "All entries in the list must be either dictionaries or not dictionaries. Cannot write list with mixed types."
-                )
-            except ValueError as e:
-                logger.error(e)
-                raise
+    # Check if list_to_write contains dictionaries (type of first entry, all entries must match,
+    # checking stops at first mismatch)
+    contains_dicts = bool(list_to_write) and isinstance(list_to_write[0], dict)
 
+    if not all(isinstance(entry, dict) == contains_dicts for entry in list_to_write):
+        try:
+            raise ValueError(
+                "All entries in the list must be either dictionaries or not dictionaries. Cannot write list with mixed types."
+            )
+        except ValueError as e:
+            logger.error(e)
+            raise
+
+    if contains_dicts:
         # Get column names from dictionaries (keys of first dictionary) if not provided
         if not column_names:
             logger.warning(
@@ -184,11 +497,30 @@ def list_to_file(list_to_write, file_name, *, column_names=None):
                 logger.error(e)
                 raise
 
-        # Convert dictionaries to lists of values based on column_names, empty string if key not found
-        list_to_write = [
-            [entry.get(col, "") for col in column_names] for entry in list_to_write
-        ]
+        # Convert dictionaries to tuples of values based on column_names, empty string if key not found
+        # (None for Parquet or Feather files, so that numeric columns stay numeric)
+        # (generator, rows are created while writing, one itemgetter call per row instead of a
+        # get call per value)
+        defaults = dict.fromkeys(
+            column_names, None if file_suffix in [".parquet", ".feather"] else ""
+        )
+        get_row = (
+            itemgetter(*column_names)
+            if len(column_names) > 1
+            else lambda entry: (entry[column_names[0]],)
+        )
+        entries = list_to_write
+
+        def iterate_rows():
+            return (get_row({**defaults, **entry}) for entry in entries)
+
+        list_to_write = iterate_rows()
     else:
+        entries = list_to_write
+
+        def iterate_rows():
+            return iter(entries)
+
         # Check if all tuples in list have the same length as the column_names list
         if column_names and not all(
             len(entry) == len(column_names) for entry in list_to_write
@@ -201,15 +533,17 @@ def list_to_file(list_to_write, file_name, *, column_names=None):
                 logger.error(e)
                 raise
 
-    file_path = Path(file_name)
-    file_suffix = file_path.suffix.lower()
-
     # Create data directory if missing
-    Path(file_name).parent.mkdir(parents=True, exist_ok=True)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
 
     if file_suffix in [".txt", ".csv"]:
         with open(
-            file_path, "w", newline="", encoding="utf-8", errors="replace"
+            file_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            errors="replace",
+            buffering=FILE_WRITE_BUFFER_SIZE,
         ) as file:
             writer = (
                 csv.writer(file, delimiter="\t")
@@ -221,15 +555,117 @@ def list_to_file(list_to_write, file_name, *, column_names=None):
                 header = column_names
                 writer.writerow(header)  # Header row
 
-            for entry in list_to_write:
-                writer.writerow(entry)
+            writer.writerows(list_to_write)
     elif file_suffix == ".xlsx":
-        df = pd.DataFrame(list_to_write, columns=column_names)
-        df.to_excel(file_path, index=False)
+        # Write rows one by one (streaming, only current row kept in memory), using faster
+        # xlsxwriter if installed, openpyxl otherwise (imported only when needed)
+        if find_spec("xlsxwriter") is not None:
+            import xlsxwriter
+
+            workbook = xlsxwriter.Workbook(
+                file_path, {"constant_memory": True, "nan_inf_to_errors": True}
+            )
+            worksheet = workbook.add_worksheet()
+            rows = [column_names] if column_names else []
+
+            for row_index, row in enumerate(chain(rows, list_to_write)):
+                # Empty cells for nan values (as for openpyxl, nan is the only value not equal to itself)
+                worksheet.write_row(
+                    row_index, 0, [None if value != value else value for value in row]
+                )
+
+            workbook.close()
+        else:
+            from openpyxl import Workbook
+
+            workbook = Workbook(write_only=True)
+            worksheet = workbook.create_sheet()
+
+            if column_names:
+                worksheet.append(column_names)
+
+            for row in list_to_write:
+                worksheet.append(row)
+
+            workbook.save(file_path)
+    elif file_suffix in [".parquet", ".feather"]:
+        # Import only when needed (writing needs pyarrow)
+        import pandas as pd
+
+        if chunk_size is None or not list_to_write:
+            # All rows at once (also for empty list, file without rows)
+            df = pd.DataFrame(list_to_write, columns=column_names)
+            df.columns = df.columns.astype(str)  # Column names must be strings
+
+            if file_suffix == ".parquet":
+                df.to_parquet(file_path, compression="zstd", index=False)
+            else:
+                df.to_feather(file_path, compression="lz4")
+        else:
+            # Convert and write chunk by chunk (only one chunk of rows kept as table in memory)
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            if schema is None:
+                # Column types from first value of each column that is not None (usually in first
+                # row, rows are not converted for this), same types for all chunks
+                # (explicit schema needed e.g. for integer column with later float values)
+                names = [str(name) for name in column_names] if column_names else None
+                first_values = {}
+
+                for row in iterate_rows():
+                    if names is None:
+                        names = [str(c_index) for c_index in range(len(row))]
+
+                    for c_index, value in enumerate(row):
+                        if value is not None:
+                            first_values.setdefault(c_index, value)
+
+                    if len(first_values) == len(names):
+                        break
+
+                schema = pa.schema(
+                    [
+                        (
+                            name,
+                            (
+                                pa.infer_type([first_values[c_index]])
+                                if c_index in first_values
+                                else pa.null()
+                            ),
+                        )
+                        for c_index, name in enumerate(names)
+                    ]
+                )
+
+            if file_suffix == ".parquet":
+                writer = pq.ParquetWriter(file_path, schema, compression="zstd")
+            else:
+                writer = pa.ipc.new_file(
+                    file_path,
+                    schema,
+                    options=pa.ipc.IpcWriteOptions(compression="lz4"),
+                )
+
+            try:
+                with writer:
+                    rows = iterate_rows()
+
+                    while chunk := list(islice(rows, chunk_size)):
+                        df = pd.DataFrame(chunk, columns=schema.names)
+                        writer.write_table(
+                            pa.Table.from_pandas(
+                                df, schema=schema, preserve_index=False
+                            )
+                        )
+            except Exception:
+                # Do not leave incomplete file
+                file_path.unlink(missing_ok=True)
+                raise
     else:
         try:
             raise ValueError(
-                "Unsupported file format. Supported formats are '.txt', '.csv' and '.xlsx'."
+                "Unsupported file format. Supported formats are '.txt', '.csv', '.xlsx', '.parquet' and '.feather'."
             )
         except ValueError as e:
             logger.error(e)